@@ -1,14 +1,49 @@
 # app_with_ontology.py
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
-from owlready2 import get_ontology, sync_reasoner
-import uuid
+from functools import lru_cache
+from itertools import count
+from werkzeug.security import safe_join
+import mimetypes
 import os
-from flask import send_from_directory
-
-app = Flask(__name__)
+import stat
+
+# Resolve the frontend folder once at import time; the path never changes.
+# It normally sits next to this file, but older checkouts kept the backend
+# in a newbackend/ subfolder, so fall back to the parent directory.
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+FRONTEND_DIR = os.path.join(_BASE_DIR, "newfrontend")
+if not os.path.isdir(FRONTEND_DIR):
+    FRONTEND_DIR = os.path.normpath(os.path.join(_BASE_DIR, "..", "newfrontend"))
+
+app = Flask(__name__, static_folder=None)
+# Match /api/solve and /api/solve/ directly instead of issuing a 308
+# redirect (one extra round trip) for the trailing-slash form.
+app.url_map.strict_slashes = False
 CORS(app)
 
+# Use orjson for request/response JSON when available (parses and dumps
+# several times faster than the stdlib module); fall back silently to
+# Flask's default provider otherwise.
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+if orjson is not None:
+    from flask.json.provider import DefaultJSONProvider
+
+    class ORJSONProvider(DefaultJSONProvider):
+        @staticmethod
+        def dumps(obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        @staticmethod
+        def loads(s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = ORJSONProvider(app)
+
 # -----------------------------
 # Load ontology (try multiple candidate filenames; use absolute file URI)
 # -----------------------------
@@ -40,97 +75,187 @@ else:
         # Last resort: use first candidate (will raise a clear error below)
         ONTO_PATH = candidate_names[0]
 
-try:
-    onto = get_ontology(ONTO_PATH).load()
-    print("Ontology loaded:", ONTO_PATH)
-except Exception as e:
-    # Attempt a robust fallback: try parsing with rdflib (if available)
+# If an earlier run already converted the source (the fallback below
+# writes Newton_law_converted.owl), start from that file instead of
+# failing on the original and re-running the conversion every boot.
+_converted = Path(__file__).with_name("Newton_law_converted.owl")
+if _converted.exists() and (
+        found_path is None or _converted.stat().st_mtime >= found_path.stat().st_mtime):
+    ONTO_PATH = str(_converted)
+
+# The API only ever reads static strings out of the ontology (hint texts
+# and unit labels) – no reasoner runs at request time. An owlready2 world
+# (with its SQLite quadstore) is therefore only needed when we actually
+# record problems into the ontology; see RECORD_IN_ONTOLOGY below. In the
+# default mode we flatten the graph once with rdflib into plain dicts and
+# free it, so steady-state memory holds no graph at all.
+
+RECORD_IN_ONTOLOGY = os.environ.get("RECORD_IN_ONTOLOGY", "").lower() in ("1", "true", "yes")
+
+ONTO_IRI = "http://example.org/its-newton#"
+
+FALLBACK_HINTS = {
+    "unit": "Check your units: use N for force, kg for mass, and m/s^2 for acceleration.",
+    "math": "Re-check your calculation – did you multiply or divide correctly?",
+    "other": "Think about which variable is missing and how to rearrange F = m × a.",
+}
+
+onto = None
+UNIT_BY_KIND = {}
+FORMULA_BY_TARGET = {}
+UNIT_LABEL = {}
+HINT_TEXT = dict(FALLBACK_HINTS)
+
+if RECORD_IN_ONTOLOGY:
+    from owlready2 import get_ontology
+
+    # Fast path: a prebuilt SQLite quadstore (see tools/build_ontology_cache.py)
+    # skips the OWL/RDF parse entirely.
+    _cache = Path(__file__).with_name("Newton_law.sqlite3")
+    if _cache.exists():
+        from owlready2 import World
+
+        _world = World(filename=str(_cache))
+        onto = _world.get_ontology(ONTO_IRI.rstrip("#")).load()
+        print("Ontology loaded from cache:", _cache)
+    else:
+        try:
+            onto = get_ontology(ONTO_PATH).load()
+            print("Ontology loaded:", ONTO_PATH)
+        except Exception as e:
+            # Attempt a robust fallback: try parsing with rdflib (if available)
+            try:
+                import rdflib
+
+                g = rdflib.Graph()
+                # Choose parser format heuristically by extension
+                if ONTO_PATH.lower().endswith(".ttl"):
+                    g.parse(ONTO_PATH, format="turtle")
+                else:
+                    # Let rdflib guess the format for rdf/xml/rdf files
+                    g.parse(ONTO_PATH)
+
+                tmp_path = Path(__file__).with_name("Newton_law_converted.owl")
+                g.serialize(destination=str(tmp_path), format="xml")
+                onto = get_ontology(str(tmp_path)).load()
+                print("Ontology loaded via conversion:", tmp_path)
+            except ModuleNotFoundError:
+                print("Could not load ontology:", e)
+                print("Conversion attempt failed: 'rdflib' is not installed. Install it with: python -m pip install rdflib")
+            except Exception as e2:
+                print("Could not load ontology:", e)
+                print("Conversion attempt failed:", e2)
+
+    if onto:
+        UNIT_BY_KIND = {
+            "mass": getattr(onto, "Kilogram", None),
+            "force": getattr(onto, "Newton", None),
+            "acceleration": getattr(onto, "MeterPerSecondSquared", None),
+        }
+        FORMULA_BY_TARGET = {
+            "force": getattr(onto, "F_equals_m_a", None),
+            "acceleration": getattr(onto, "a_equals_F_div_m", None),
+            "mass": getattr(onto, "m_equals_F_div_a", None),
+        }
+        UNIT_LABEL = {kind: ind.label.first()
+                      for kind, ind in UNIT_BY_KIND.items()
+                      if ind and ind.label}
+        for _key, _name in (("unit", "Hint_Units"),
+                            ("formula", "Hint_Formula"),
+                            ("math", "Hint_Arithmetic")):
+            _hint = getattr(onto, _name, None)
+            if _hint and _hint.displayText:
+                HINT_TEXT[_key] = _hint.displayText[0]
+else:
+    # Default path: flatten the graph into dicts with rdflib, then free it.
     try:
         import rdflib
 
         g = rdflib.Graph()
-        # Choose parser format heuristically by extension
         if ONTO_PATH.lower().endswith(".ttl"):
-            parse_fmt = "turtle"
+            g.parse(ONTO_PATH, format="turtle")
         else:
-            parse_fmt = None
-
-        if parse_fmt:
-            g.parse(ONTO_PATH, format=parse_fmt)
-        else:
-            # Let rdflib guess the format for rdf/xml/rdf files
             g.parse(ONTO_PATH)
 
-        tmp_path = Path(__file__).with_name("Newton_law_converted.owl")
-        g.serialize(destination=str(tmp_path), format="xml")
-        onto = get_ontology(str(tmp_path)).load()
-        print("Ontology loaded via conversion:", tmp_path)
-    except ModuleNotFoundError:
-        onto = None
-        print("Could not load ontology:", e)
-        print("Conversion attempt failed: 'rdflib' is not installed. Install it with: python -m pip install rdflib")
-    except Exception as e2:
-        onto = None
-        print("Could not load ontology:", e)
-        print("Conversion attempt failed:", e2)
+        _display_text = rdflib.URIRef(ONTO_IRI + "displayText")
+        for _key, _name in (("unit", "Hint_Units"),
+                            ("formula", "Hint_Formula"),
+                            ("math", "Hint_Arithmetic")):
+            _val = g.value(rdflib.URIRef(ONTO_IRI + _name), _display_text)
+            if _val is not None:
+                HINT_TEXT[_key] = str(_val)
+        for _kind, _name in (("mass", "Kilogram"),
+                             ("force", "Newton"),
+                             ("acceleration", "MeterPerSecondSquared")):
+            _val = g.value(rdflib.URIRef(ONTO_IRI + _name), rdflib.RDFS.label)
+            if _val is not None:
+                UNIT_LABEL[_kind] = str(_val)
+        del g
+        print("Ontology flattened:", ONTO_PATH)
+    except Exception as e:
+        print("Could not read ontology (using fallback hints):", e)
 
 
 # -----------------------------
 # Helper: units, hints, formulas
 # -----------------------------
+# All helpers are plain dict lookups against the tables built above.
+
+
+# Symbol that must appear in a student's unit string for each target.
+EXPECTED_UNIT_TOKENS = {
+    "force": "N",
+    "mass": "kg",
+    "acceleration": "m/s",
+}
+
+# The tables above never change after import, so the helpers are pure and
+# safe to memoize. The public wrappers lower-case first so the cache key
+# space stays at the handful of canonical strings.
+
+@lru_cache(maxsize=8)
+def _unit_individual(kind):
+    return UNIT_BY_KIND.get(kind)
+
 
 def get_unit_individual(kind: str):
     """Return the ontology unit individual for mass/force/acceleration."""
-    if not onto:
-        return None
-    if kind.lower() == "mass":
-        return onto.Kilogram
-    if kind.lower() == "force":
-        return onto.Newton
-    if kind.lower() == "acceleration":
-        return onto.MeterPerSecondSquared
-    return None
+    return _unit_individual(kind.lower())
 
 
+@lru_cache(maxsize=8)
 def get_hint_from_ontology(error_type: str):
-    """Return hint text from Hint individuals in ontology, if available."""
-    if not onto:
-        # Fallback messages if ontology failed to load
-        if error_type == "unit":
-            return "Check your units: use N for force, kg for mass, and m/s^2 for acceleration."
-        if error_type == "math":
-            return "Re-check your calculation – did you multiply or divide correctly?"
-        return "Think about which variable is missing and how to rearrange F = m × a."
+    """Return hint text resolved from the ontology's Hint individuals."""
+    return HINT_TEXT.get(error_type, HINT_TEXT["other"])
 
-    if error_type == "unit" and hasattr(onto, "Hint_Units"):
-        return onto.Hint_Units.displayText[0]
-    if error_type == "formula" and hasattr(onto, "Hint_Formula"):
-        return onto.Hint_Formula.displayText[0]
-    if error_type == "math" and hasattr(onto, "Hint_Arithmetic"):
-        return onto.Hint_Arithmetic.displayText[0]
 
-    # generic/fallback
-    return "Think about which variable is missing and how to rearrange F = m × a."
+@lru_cache(maxsize=8)
+def _formula_for_target(target):
+    return FORMULA_BY_TARGET.get(target)
 
 
 def choose_formula_for_target(target: str):
     """Return a Formula individual from ontology based on unknown quantity."""
-    if not onto:
-        return None
-    t = target.lower()
-    if t == "force" and hasattr(onto, "F_equals_m_a"):
-        return onto.F_equals_m_a
-    if t == "acceleration" and hasattr(onto, "a_equals_F_div_m"):
-        return onto.a_equals_F_div_m
-    if t == "mass" and hasattr(onto, "m_equals_F_div_a"):
-        return onto.m_equals_F_div_a
-    return None
+    return _formula_for_target(target.lower())
 
 
 # -----------------------------
 # Arithmetic helpers
 # -----------------------------
 
+def _to_float(x):
+    try:
+        return float(x)
+    except (TypeError, ValueError):
+        return None
+
+
+def _given_value(given, key):
+    """Pull given[key]["value"] as a float, or None if absent/invalid."""
+    quantity = given.get(key)
+    return _to_float(quantity.get("value")) if quantity else None
+
+
 def compute_force(mass: float, accel: float) -> float:
     return mass * accel
 
@@ -143,40 +268,69 @@ def compute_mass(force: float, accel: float) -> float:
     return force / accel
 
 
-def classify_error(student_value, correct_value):
-    """Simple numeric error classifier (math vs correct)."""
-    if student_value is None:
-        return "missing"
-    if correct_value is None:
-        return "other"
+TARGET_ID = {"force": 0, "acceleration": 1, "mass": 2}
+
 
-    if correct_value == 0:
-        diff = abs(student_value - correct_value)
+def evaluate(target_id, m_val, a_val, f_val, student_value):
+    """
+    Fused hot-path helper: compute the correct value for the target and
+    classify the student's answer in a single call (one interpreter frame
+    instead of a helper call per step). Returns (correct_value, error_type).
+    """
+    if target_id == 0:
+        if m_val is None or a_val is None:
+            raise ValueError("Mass and acceleration are required to compute force.")
+        correct_value = m_val * a_val
+    elif target_id == 1:
+        if f_val is None or m_val is None:
+            raise ValueError("Force and mass are required to compute acceleration.")
+        correct_value = f_val / m_val
     else:
-        diff = abs(student_value - correct_value) / abs(correct_value)
+        if f_val is None or a_val is None:
+            raise ValueError("Force and acceleration are required to compute mass.")
+        correct_value = f_val / a_val
 
+    if student_value is None:
+        return correct_value, "missing"
+
+    # Relative error, falling back to absolute error when the correct
+    # value is zero; within 1% is correct, beyond 5% is a math error
+    diff = student_value - correct_value
+    if diff < 0:
+        diff = -diff
+    scale = correct_value if correct_value >= 0 else -correct_value
+    if scale:
+        diff /= scale
     if diff <= 0.01:
-        return "none"
-    if diff > 0.05:
-        return "math"
-    return "other"
+        return correct_value, "none"
+    return correct_value, ("math" if diff > 0.05 else "other")
 
 
 # -----------------------------
-# Ontology-based problem creation
+# Ontology-based problem creation (debug/inspection only)
 # -----------------------------
+# Recording every request as NumericProblem/Mass/Acceleration/Force
+# individuals writes to owlready2's SQLite quadstore and grows the
+# ontology without bound, so it is off by default; RECORD_IN_ONTOLOGY is
+# read once in the loader section above.
+
+# Names only need to be unique within this process's ontology namespace,
+# so a counter is enough; count().__next__ is atomic in CPython and avoids
+# four os.urandom() reads per recorded problem.
+_next_id = count().__next__
 
-def create_problem_from_request(target, given_dict):
+
+def create_problem_from_request(target, m_val, a_val, f_val):
     """
     Create a NumericProblem + Mass/Acceleration/Force individuals in the ontology
-    and attach values/units from the request.
+    and attach the already-parsed values (floats or None) plus units.
     Returns (problem_instance, mass_ind, accel_ind, force_ind)
     """
     if not onto:
         return None, None, None, None
 
     with onto:
-        p_name = f"Problem_{uuid.uuid4().hex}"
+        p_name = f"Problem_{_next_id()}"
         p = onto.NumericProblem(p_name)
 
         # Attach formula used for this problem based on what is unknown
@@ -185,19 +339,19 @@ def create_problem_from_request(target, given_dict):
             p.usesFormula.append(formula)
 
         # Mass
-        m_ind = onto.Mass(f"Mass_{uuid.uuid4().hex}")
+        m_ind = onto.Mass(f"Mass_{_next_id()}")
         unit_m = get_unit_individual("mass")
         if unit_m:
             m_ind.hasUnit.append(unit_m)
 
         # Acceleration
-        a_ind = onto.Acceleration(f"Acceleration_{uuid.uuid4().hex}")
+        a_ind = onto.Acceleration(f"Acceleration_{_next_id()}")
         unit_a = get_unit_individual("acceleration")
         if unit_a:
             a_ind.hasUnit.append(unit_a)
 
         # Force
-        f_ind = onto.Force(f"Force_{uuid.uuid4().hex}")
+        f_ind = onto.Force(f"Force_{_next_id()}")
         unit_f = get_unit_individual("force")
         if unit_f:
             f_ind.hasUnit.append(unit_f)
@@ -207,25 +361,14 @@ def create_problem_from_request(target, given_dict):
         p.hasQuantity.append(a_ind)
         p.hasQuantity.append(f_ind)
 
-        # Fill known values from request
-        def to_float(x):
-            try:
-                return float(x)
-            except (TypeError, ValueError):
-                return None
-
-        m_val = to_float(given_dict.get("mass", {}).get("value"))
-        a_val = to_float(given_dict.get("acceleration", {}).get("value"))
-        f_val = to_float(given_dict.get("force", {}).get("value"))
-
+        # Fill known values from request; numericalValue is functional in
+        # the ontology, so owlready2 takes a bare float (no list wrapping)
         if m_val is not None:
-            # owlready2 object properties that hold values are often multi-valued
-            # assign as a single-element list or use .append()
-            m_ind.numericalValue = [m_val]
+            m_ind.numericalValue = m_val
         if a_val is not None:
-            a_ind.numericalValue = [a_val]
+            a_ind.numericalValue = a_val
         if f_val is not None:
-            f_ind.numericalValue = [f_val]
+            f_ind.numericalValue = f_val
 
     return p, m_ind, a_ind, f_ind
 
@@ -236,30 +379,29 @@ def solve_with_ontology(target, p, mass, accel, force):
     then write the answer back into the appropriate quantity individual.
     (You could call sync_reasoner() here if you want SWRL to do it instead.)
     """
-    # Extract values if present
-    m_val = float(mass.numericalValue[0]) if hasattr(mass, "numericalValue") and mass.numericalValue else None
-    a_val = float(accel.numericalValue[0]) if hasattr(accel, "numericalValue") and accel.numericalValue else None
-    f_val = float(force.numericalValue[0]) if hasattr(force, "numericalValue") and force.numericalValue else None
+    # Extract values if present (functional property -> scalar or None)
+    m_val = mass.numericalValue
+    a_val = accel.numericalValue
+    f_val = force.numericalValue
 
     correct_value = None
     if target == "force":
         if m_val is None or a_val is None:
             raise ValueError("Mass and acceleration are required to compute force.")
         correct_value = compute_force(m_val, a_val)
-        # write back as a list value
-        force.numericalValue = [correct_value]
+        force.numericalValue = correct_value
 
     elif target == "acceleration":
         if f_val is None or m_val is None:
             raise ValueError("Force and mass are required to compute acceleration.")
         correct_value = compute_accel(f_val, m_val)
-        accel.numericalValue = [correct_value]
+        accel.numericalValue = correct_value
 
     elif target == "mass":
         if f_val is None or a_val is None:
             raise ValueError("Force and acceleration are required to compute mass.")
         correct_value = compute_mass(f_val, a_val)
-        mass.numericalValue = [correct_value]
+        mass.numericalValue = correct_value
 
     else:
         raise ValueError("Invalid target")
@@ -271,7 +413,15 @@ def solve_with_ontology(target, p, mass, accel, force):
 # API endpoint
 # -----------------------------
 
-@app.route("/api/solve", methods=["POST"])
+# Correct answers share a fixed response shape, so the hot success path
+# fills a template string instead of building and serializing a dict.
+# target comes from TARGET_ID and correct_value is a float, so neither
+# needs JSON escaping.
+_OK_TMPL = '{{"correct":true,"correctValue":{cv},"target":"{t}","errorType":"none","hint":null}}'
+
+# Note: automatic OPTIONS stays enabled – flask-cors answers the browser
+# preflight through it, and disabling it turns preflights into 405s.
+@app.route("/api/solve", methods=["POST"], strict_slashes=False)
 def solve():
     """
     Expects JSON like:
@@ -290,88 +440,105 @@ def solve():
     given = data.get("given", {})
     student = data.get("studentAnswer", {})
 
-    # Create ontology-based problem
-    p, m_ind, a_ind, f_ind = create_problem_from_request(target, given)
-    if not onto or not p:
-        return jsonify({"error": "Ontology not available; cannot perform intelligent reasoning."}), 500
+    # Check the student's unit first: a wrong unit decides the verdict on
+    # its own, so there is no point recording the problem in the ontology.
+    # Very loose check: the expected symbol must appear in the unit string.
+    student_value = _to_float(student.get("value"))
+    student_unit = student.get("unit", "")
+    tok = EXPECTED_UNIT_TOKENS.get(target)
+    error_type = "unit" if (tok and student_unit and tok not in student_unit) else "none"
+
+    target_id = TARGET_ID.get(target)
+    if target_id is None:
+        return jsonify({"error": "Invalid target"}), 400
+
+    m_val = _given_value(given, "mass")
+    a_val = _given_value(given, "acceleration")
+    f_val = _given_value(given, "force")
 
-    # Compute correct value using ontology-backed structure
+    # Compute the correct value and classify the numeric answer in one call
     try:
-        correct_value = solve_with_ontology(target, p, m_ind, a_ind, f_ind)
+        correct_value, value_error = evaluate(target_id, m_val, a_val, f_val, student_value)
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
     except ZeroDivisionError:
         return jsonify({"error": "Division by zero – check your input values."}), 400
 
-    # Student answer
-    def to_float(x):
-        try:
-            return float(x)
-        except (TypeError, ValueError):
-            return None
-
-    student_value = to_float(student.get("value"))
-    student_unit = student.get("unit", "")
-
-    # Very simple unit check using requested unit vs ontology default
-    error_type = "none"
-    # If the student provided a unit that doesn't match the ontology's expected unit, flag as unit error
-    expected_unit = get_unit_individual(target)
-    if expected_unit and student_unit:
-        expected_str = expected_unit.label.first() if expected_unit.label else ""
-        # Very loose check: just make sure the correct symbol is in there
-        if target == "force" and "N" not in student_unit:
-            error_type = "unit"
-        elif target == "mass" and "kg" not in student_unit:
-            error_type = "unit"
-        elif target == "acceleration" and "m/s" not in student_unit:
-            error_type = "unit"
+    # Optionally mirror the problem into the ontology for inspection
+    if RECORD_IN_ONTOLOGY and onto and error_type != "unit":
+        p, m_ind, a_ind, f_ind = create_problem_from_request(target, m_val, a_val, f_val)
+        if p:
+            solve_with_ontology(target, p, m_ind, a_ind, f_ind)
 
     if error_type == "none":
-        error_type = classify_error(student_value, correct_value)
+        error_type = value_error
 
-    is_correct = (error_type == "none")
-
-    # Get hint from ontology
-    hint = None
-    if not is_correct:
-        hint = get_hint_from_ontology("unit" if error_type == "unit" else
-                                      "math" if error_type == "math" else
-                                      "formula" if error_type == "formula" else
-                                      "other")
+    if error_type == "none":
+        return Response(_OK_TMPL.format(cv=correct_value, t=target),
+                        mimetype="application/json")
 
+    # Hint texts were resolved from the ontology at startup; error_type is
+    # already the HINT_TEXT key (anything unknown falls back to "other")
     response = {
-        "correct": is_correct,
+        "correct": False,
         "correctValue": correct_value,
         "target": target,
         "errorType": error_type,
-        "hint": hint,
+        "hint": HINT_TEXT.get(error_type, HINT_TEXT["other"]),
     }
     return jsonify(response)
 
 
+# The frontend is a handful of small files, so keep their bytes in memory
+# and only re-read when the file's mtime changes. Maps the requested name
+# to (mtime, body, mimetype).
+_STATIC_CACHE = {}
+
+
+def _send_cached(filename):
+    path = safe_join(FRONTEND_DIR, filename)
+    if path is None:
+        return ("File not found", 404)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return ("File not found", 404)
+    # Directories (e.g. GET /frontend/.) and other non-regular files 404
+    # like send_from_directory did, instead of crashing in open()
+    if not stat.S_ISREG(st.st_mode):
+        return ("File not found", 404)
+
+    entry = _STATIC_CACHE.get(filename)
+    if entry is None or entry[0] != st.st_mtime:
+        with open(path, "rb") as f:
+            body = f.read()
+        mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        entry = (st.st_mtime, body, mimetype)
+        _STATIC_CACHE[filename] = entry
+
+    return Response(entry[1], mimetype=entry[2])
+
+
 @app.route("/", methods=["GET"])
 def serve_index():
-    """Serve the frontend index.html from the sibling `newfrontend` folder."""
-    # Build absolute path to newfrontend directory (sibling to backend)
-    base_dir = os.path.dirname(__file__)
-    frontend_dir = os.path.normpath(os.path.join(base_dir, "..", "newfrontend"))
-    index_path = os.path.join(frontend_dir, "index.html")
-    if os.path.exists(index_path):
-        return send_from_directory(frontend_dir, "index.html")
-    return ("index.html not found in newfrontend directory.", 404)
+    """Serve the frontend index.html from the `newfrontend` folder."""
+    return _send_cached("index.html")
 
 
-@app.route('/frontend/<path:filename>')
+@app.route("/frontend/<path:filename>")
 def serve_frontend_file(filename):
     """Serve static files from the newfrontend folder (e.g., JS/CSS)."""
-    base_dir = os.path.dirname(__file__)
-    frontend_dir = os.path.normpath(os.path.join(base_dir, "..", "newfrontend"))
-    file_path = os.path.join(frontend_dir, filename)
-    if os.path.exists(file_path):
-        return send_from_directory(frontend_dir, filename)
-    return ("File not found", 404)
+    return _send_cached(filename)
 
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000, debug=True)
+    # Werkzeug's debug server is single-threaded and reloads on file
+    # change (re-running the ontology load per fork), so it is opt-in.
+    # The production entry point is gunicorn; --preload loads the
+    # ontology once in the master instead of once per worker:
+    #   gunicorn -w 4 -k gthread --threads 8 --preload app_with_ontology:app
+    if os.environ.get("FLASK_DEV"):
+        app.run(host="0.0.0.0", port=5000, debug=True)
+    else:
+        print("Set FLASK_DEV=1 for the debug server, or run under gunicorn:")
+        print("  gunicorn -w 4 -k gthread --threads 8 --preload app_with_ontology:app")
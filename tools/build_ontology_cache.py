@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# tools/build_ontology_cache.py
+#
+# One-shot converter for the backend's ontology. Parsing the OWL/RDF (or
+# converting TTL via rdflib) on every process start is the slow part of
+# boot, so this script does the pipeline once and saves the result into an
+# owlready2 SQLite quadstore (Newton_law.sqlite3) next to the app. When
+# that file exists, app_with_ontology.py loads the quadstore directly and
+# skips parsing entirely.
+#
+# Usage: python tools/build_ontology_cache.py
+
+import sys
+from pathlib import Path
+
+from owlready2 import World
+
+# Keep in sync with candidate_names in app_with_ontology.py
+CANDIDATE_NAMES = [
+    "Newton_2ndLaw.owl",
+    "Newton_2ndLaw.rdf",
+    "Newton_law.ttl",
+]
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+CACHE_PATH = BASE_DIR / "Newton_law.sqlite3"
+
+
+def main():
+    src = None
+    for name in CANDIDATE_NAMES:
+        p = BASE_DIR / name
+        if p.exists():
+            src = p
+            break
+    if src is None:
+        sys.exit(f"No ontology source found in {BASE_DIR} (tried {CANDIDATE_NAMES})")
+
+    load_path = src
+    if src.suffix.lower() == ".ttl":
+        # owlready2 cannot parse turtle; convert to RDF/XML via rdflib first
+        import rdflib
+
+        g = rdflib.Graph()
+        g.parse(str(src), format="turtle")
+        load_path = BASE_DIR / "Newton_law_converted.owl"
+        g.serialize(destination=str(load_path), format="xml")
+        print("Converted", src.name, "->", load_path.name)
+
+    if CACHE_PATH.exists():
+        CACHE_PATH.unlink()
+
+    world = World(filename=str(CACHE_PATH))
+    world.get_ontology(str(load_path)).load()
+    world.save()
+    world.close()
+    print("Wrote", CACHE_PATH)
+
+
+if __name__ == "__main__":
+    main()